@@ -1,8 +1,26 @@
+import asyncio
+import hashlib
+from collections import Counter
 import streamlit as st
 import pandas as pd
 from utils.validation import validate_github_url
 from utils.visualization import create_branch_visualization
-from utils.github_data import GitHubDataFetcher
+from utils.github_data import AsyncGitHubDataFetcher, ETagCache
+
+@st.cache_data(show_spinner=False)
+def parse_repo_url(url):
+    """Cached wrapper around validate_github_url"""
+    return validate_github_url(url)
+
+@st.cache_data(ttl=600, show_spinner=False)
+def load_repository_data(owner, repo_name, token_hash, commit_limit, _token):
+    """
+    Fetch commit and branch data, cached for 10 minutes.
+    This is the only network call on the analyze path, so a cache hit makes no requests.
+    The raw token is excluded from the cache key; token_hash stands in for it.
+    """
+    fetcher = AsyncGitHubDataFetcher(_token, etag_cache=ETagCache())
+    return asyncio.run(fetcher.fetch_all(owner, repo_name, commit_limit))
 
 def create_sidebar():
     """Create and configure the sidebar"""
@@ -42,6 +60,9 @@ def create_sidebar():
             help="Click to start analyzing the repository"
         )
         
+        if st.button("Clear cache", help="Discard cached repository data and fetch it again"):
+            st.cache_data.clear()
+        
     return repo_url, github_token, commit_limit, analyze_button
 
 def display_commit_history(commits_data):
@@ -52,7 +73,11 @@ def display_commit_history(commits_data):
         st.warning("No commit data available")
         return
         
-    df_commits = pd.DataFrame(commits_data)
+    authors = Counter(commit['author'] for commit in commits_data)
+    # Arrow-backed columns store strings contiguously and serialize to the frontend without conversion
+    df_commits = pd.DataFrame(commits_data).convert_dtypes(dtype_backend='pyarrow')
+    # Few distinct authors, so store them as category codes
+    df_commits['author'] = df_commits['author'].astype('category')
     st.dataframe(df_commits, use_container_width=True)
     
     col1, col2 = st.columns(2)
@@ -60,11 +85,10 @@ def display_commit_history(commits_data):
         st.metric("Total Commits Analyzed", len(commits_data))
     
     with col2:
-        authors = df_commits['author'].value_counts()
         st.metric("Unique Contributors", len(authors))
     
     st.subheader("Author Contributions")
-    st.bar_chart(authors)
+    st.bar_chart(pd.Series(dict(authors.most_common()), name='count').rename_axis('author'))
 def display_branch_info(branch_data):
     """Display branch information and statistics"""
     st.subheader("Branch Information")
@@ -73,14 +97,14 @@ def display_branch_info(branch_data):
         st.warning("No branch data available")
         return
         
-    df_branches = pd.DataFrame(branch_data)
+    df_branches = pd.DataFrame(branch_data).convert_dtypes(dtype_backend='pyarrow')
     st.dataframe(df_branches, use_container_width=True)
     
     col1, col2 = st.columns(2)
     with col1:
         st.metric("Total Branches", len(branch_data))
     with col2:
-        protected_branches = len([b for b in branch_data if b['protected']])
+        protected_branches = sum(1 for b in branch_data if b['protected'])
         st.metric("Protected Branches", protected_branches)
 
 def main():
@@ -97,17 +121,14 @@ def main():
     if analyze_button:
         try:
             # Validate URL and get owner/repo
-            owner, repo_name = validate_github_url(repo_url)
-            
-            # Initialize GitHub client and fetch data
-            github_fetcher = GitHubDataFetcher(github_token)
-            
-            with st.spinner("Connecting to GitHub..."):
-                repo = github_fetcher.get_repository(owner, repo_name)
+            owner, repo_name = parse_repo_url(repo_url)
             
+            # Fetch repository data (cached; errors surface as ValueError)
             with st.spinner("Fetching repository data..."):
-                commits_data = github_fetcher.get_commit_data(repo, commit_limit)
-                branch_data = github_fetcher.get_branch_data(repo)
+                token_hash = hashlib.sha256(github_token.encode()).hexdigest()
+                commits_data, branch_data = load_repository_data(
+                    owner, repo_name, token_hash, commit_limit, github_token
+                )
                 
                 # Show repository info
                 st.success(f"Successfully connected to {owner}/{repo_name}")
@@ -1,53 +1,156 @@
-from github import Github, GithubException
+import asyncio
+import hashlib
+import json
+import math
+import os
+import sys
+import tempfile
+from datetime import datetime
+import aiohttp
 from typing import Optional, Tuple, List, Dict, Any
 
-class GitHubDataFetcher:
-    def __init__(self, token: Optional[str] = None):
-        self.github = Github(token) if token else Github()
+# GitHub's maximum page size for list endpoints
+PER_PAGE = 100
+
+def raise_for_github_status(status: int, message: str, full_name: str):
+    """
+    Translate a GitHub API error status into a ValueError with a clear message.
+    """
+    if status == 404:
+        raise ValueError(f"Repository '{full_name}' not found. Please check the URL and try again.")
+    elif status == 401:
+        raise ValueError("Invalid GitHub token. Please check your token and try again.")
+    elif status == 403:
+        if 'rate limit' in message.lower():
+            raise ValueError("GitHub API rate limit exceeded. Please add a GitHub token to increase the limit.")
+        else:
+            raise ValueError("Access denied. Please check your permissions and token.")
+    else:
+        raise ValueError(f"GitHub API error: {message}")
+
+class ETagCache:
+    """
+    On-disk store of GitHub API pages and their ETags.
+    Lets repeated requests revalidate with If-None-Match and reuse the stored
+    page on 304 Not Modified, which GitHub doesn't count against the rate limit.
+    """
+    DEFAULT_DIR = os.path.join(os.path.expanduser("~"), ".cache", "github-repo-visualizer")
+
+    def __init__(self, cache_dir: str = DEFAULT_DIR):
+        self.cache_dir = cache_dir
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, hashlib.sha256(key.encode()).hexdigest() + ".json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored entry for key, or None if missing or unreadable"""
+        try:
+            with open(self._path(key)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, entry: Dict[str, Any]):
+        """Store entry for key, replacing the file atomically"""
+        tmp_path = None
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Unique temp name per writer, so concurrent sessions can't interleave writes
+            with tempfile.NamedTemporaryFile("w", dir=self.cache_dir, suffix=".tmp", delete=False) as f:
+                tmp_path = f.name
+                json.dump(entry, f)
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            # Caching is best effort; a read-only filesystem just means no revalidation
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+class AsyncGitHubDataFetcher:
+    API_URL = "https://api.github.com"
+
+    def __init__(self, token: Optional[str] = None, etag_cache: Optional[ETagCache] = None):
+        self.headers = {"Accept": "application/vnd.github+json"}
+        if token:
+            self.headers["Authorization"] = f"token {token}"
+        self.etag_cache = etag_cache
+        # Cached pages are keyed per token so private data never leaks across tokens
+        self.token_hash = hashlib.sha256((token or "").encode()).hexdigest()
+
+    async def fetch_all(self, owner: str, repo_name: str,
+                        limit: int = 100) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Fetch commit and branch data concurrently.
+        Returns (commits_data, branch_data) as lists of dicts.
+        """
+        connector = aiohttp.TCPConnector(limit=10)
+        async with aiohttp.ClientSession(headers=self.headers, connector=connector) as session:
+            return await asyncio.gather(
+                self.get_commit_data(session, owner, repo_name, limit),
+                self.get_branch_data(session, owner, repo_name)
+            )
+
+    async def _get_page(self, session: aiohttp.ClientSession, owner: str, repo_name: str,
+                        endpoint: str, page: int) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Fetch a single page of a list endpoint.
+        Returns the page items and the last page number from the Link header.
+        """
+        url = f"{self.API_URL}/repos/{owner}/{repo_name}/{endpoint}"
+        params = {"per_page": PER_PAGE, "page": page}
+        
+        cache_key = f"{self.token_hash}:{url}?per_page={PER_PAGE}&page={page}"
+        cached = self.etag_cache.get(cache_key) if self.etag_cache else None
+        headers = {"If-None-Match": cached["etag"]} if cached else None
         
-    def get_repository(self, owner: str, repo_name: str):
+        async with session.get(url, params=params, headers=headers) as response:
+            if response.status == 304 and cached:
+                return cached["items"], cached["last_page"]
+            if response.status != 200:
+                raise_for_github_status(response.status, await response.text(), f"{owner}/{repo_name}")
+            last_page = page
+            if "last" in response.links:
+                last_page = int(response.links["last"]["url"].query.get("page", page))
+            items = await response.json()
+            
+            etag = response.headers.get("ETag")
+            if self.etag_cache and etag:
+                self.etag_cache.set(cache_key, {"etag": etag, "items": items, "last_page": last_page})
+            return items, last_page
+
+    async def get_branch_data(self, session: aiohttp.ClientSession,
+                              owner: str, repo_name: str) -> List[Dict[str, Any]]:
+        """Fetch branch information, requesting all pages after the first concurrently"""
+        branches, last_page = await self._get_page(session, owner, repo_name, "branches", 1)
+        pages = await asyncio.gather(*(
+            self._get_page(session, owner, repo_name, "branches", page)
+            for page in range(2, last_page + 1)
+        ))
+        for items, _ in pages:
+            branches.extend(items)
+
+        return [{
+            'name': branch['name'],
+            'commit': branch['commit']['sha'],
+            'protected': branch['protected']
+        } for branch in branches]
+
+    async def get_commit_data(self, session: aiohttp.ClientSession,
+                              owner: str, repo_name: str, limit: int = 100) -> List[Dict[str, Any]]:
         """
-        Safely fetch repository information.
-        Raises appropriate exceptions with clear messages.
+        Fetch commit information, requesting all needed pages concurrently.
+        SHAs and author names are interned, since parents and authors repeat across commits.
         """
-        try:
-            repo = self.github.get_repo(f"{owner}/{repo_name}")
-            # Test access by fetching basic info
-            repo.name
-            return repo
-        except GithubException as e:
-            if e.status == 404:
-                raise ValueError(f"Repository '{owner}/{repo_name}' not found. Please check the URL and try again.")
-            elif e.status == 401:
-                raise ValueError("Invalid GitHub token. Please check your token and try again.")
-            elif e.status == 403:
-                if 'rate limit' in str(e).lower():
-                    raise ValueError("GitHub API rate limit exceeded. Please add a GitHub token to increase the limit.")
-                else:
-                    raise ValueError("Access denied. Please check your permissions and token.")
-            else:
-                raise ValueError(f"GitHub API error: {str(e)}")
-
-    def get_branch_data(self, repo) -> List[Dict[str, Any]]:
-        """Fetch branch information from GitHub repository"""
-        try:
-            return [{
-                'name': branch.name,
-                'commit': branch.commit.sha,
-                'protected': branch.protected
-            } for branch in repo.get_branches()]
-        except GithubException as e:
-            raise ValueError(f"Error fetching branch data: {str(e)}")
-
-    def get_commit_data(self, repo, limit: int = 100) -> List[Dict[str, Any]]:
-        """Fetch commit information from GitHub repository"""
-        try:
-            return [{
-                'sha': commit.sha,
-                'message': commit.commit.message,
-                'author': commit.commit.author.name,
-                'date': commit.commit.author.date.strftime('%Y-%m-%d %H:%M:%S'),
-                'parents': [p.sha for p in commit.parents]
-            } for commit in repo.get_commits()[:limit]]
-        except GithubException as e:
-            raise ValueError(f"Error fetching commit data: {str(e)}")
+        pages = await asyncio.gather(*(
+            self._get_page(session, owner, repo_name, "commits", page)
+            for page in range(1, math.ceil(limit / PER_PAGE) + 1)
+        ))
+        commits = [commit for items, _ in pages for commit in items][:limit]
+
+        return [{
+            'sha': sys.intern(commit['sha']),
+            'message_short': commit['commit']['message'].split('\n', 1)[0][:80],
+            'author': sys.intern(commit['commit']['author']['name']),
+            'date': datetime.fromisoformat(commit['commit']['author']['date'][:19]),
+            'parents': [sys.intern(p['sha']) for p in commit['parents']]
+        } for commit in commits]
@@ -1,6 +1,11 @@
-from urllib.parse import urlparse
 import re
 
+# Host check, owner/repo extraction and name validation in a single match
+_GITHUB_URL_RE = re.compile(r'^(?i:https?)://github\.com/+([\w.-]+)/+([\w.-]+)(?:[/?#].*)?\Z', re.DOTALL)
+
+# Looser form, only used to pick the right error message when the URL is rejected
+_GITHUB_HOST_RE = re.compile(r'^(?i:https?)://github\.com(?=[/?#]|\Z)/*([^/?#]*)/*([^/?#]*)')
+
 def validate_github_url(url):
     """
     Validate GitHub repository URL and extract owner/repo.
@@ -8,28 +13,21 @@ def validate_github_url(url):
     """
     if not url:
         raise ValueError("Please enter a GitHub repository URL")
-        
+
     # Clean the URL
-    url = url.strip().rstrip('/')
-    
-    # Parse URL
-    parsed = urlparse(url)
-    
+    url = url.strip()
+
+    match = _GITHUB_URL_RE.match(url)
+    if match:
+        return match.group(1), match.group(2)
+
     # Check if it's a GitHub URL
-    if parsed.netloc != 'github.com':
+    host_match = _GITHUB_HOST_RE.match(url)
+    if not host_match:
         raise ValueError("Please enter a valid GitHub URL (https://github.com/owner/repo)")
-    
-    # Extract path components
-    path_parts = [p for p in parsed.path.split('/') if p]
-    
+
     # Check if we have owner/repo format
-    if len(path_parts) < 2:
+    if not host_match.group(1) or not host_match.group(2):
         raise ValueError("URL must be in format: https://github.com/owner/repo")
-        
-    owner, repo_name = path_parts[0], path_parts[1]
-    
-    # Validate owner and repo names
-    if not re.match(r'^[\w.-]+$', owner) or not re.match(r'^[\w.-]+$', repo_name):
-        raise ValueError("Invalid repository owner or name format")
-        
-    return owner, repo_name
\ No newline at end of file
+
+    raise ValueError("Invalid repository owner or name format")
@@ -1,5 +1,5 @@
+import numpy as np
 import plotly.graph_objects as go
-from datetime import datetime
 from collections import defaultdict
 from typing import Dict, List, Tuple, Any
 
@@ -30,124 +30,159 @@ class BranchVisualizer:
         
         for branch in branch_data:
             branch_name = branch['name']
-            color_assigned = False
             
-            # Check if branch name contains any predefined type
+            # Check if branch name contains any predefined type (first listed type wins)
+            lower_name = branch_name.lower()
             for branch_type, color in self.branch_colors.items():
-                if branch_type in branch_name.lower():
+                if branch_type in lower_name:
                     branch_to_color[branch_name] = color
-                    color_assigned = True
                     break
-            
-            # Assign default color if no predefined type matches
-            if not color_assigned:
+            else:
+                # Assign default color if no predefined type matches
                 branch_to_color[branch_name] = self.default_colors[used_colors % len(self.default_colors)]
                 used_colors += 1
                 
         return branch_to_color
 
-    def process_commit_data(self, 
-                          commits_data: List[Dict[str, Any]], 
-                          branch_data: List[Dict[str, Any]]) -> Tuple[Dict[str, List[str]], Dict[str, datetime], Dict[str, List[str]]]:
+    def build_commit_arrays(self,
+                            commits_data: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[List[int]]]:
         """
-        Process commit data to determine branch relationships and commit dates
+        Convert commit data into parallel arrays indexed by commit position.
+        Parents are stored as indices into these arrays, or -1 if not fetched.
         """
-        # Create mappings
-        commit_to_branch = defaultdict(list)
-        branch_tips = {branch['name']: branch['commit'] for branch in branch_data}
+        sha_list = [commit['sha'] for commit in commits_data]
+        sha_to_idx = {sha: idx for idx, sha in enumerate(sha_list)}
         
-        # Create commit parent and date mappings
-        commit_parents = {
-            commit['sha']: commit['parents'] 
+        shas = np.array(sha_list)
+        dates = np.array([commit['date'] for commit in commits_data], dtype='datetime64[s]')
+        authors = np.array([commit['author'] for commit in commits_data], dtype=object)
+        parents = [
+            [sha_to_idx.get(parent, -1) for parent in commit['parents']]
             for commit in commits_data
-        }
+        ]
         
-        commit_dates = {
-            commit['sha']: datetime.strptime(commit['date'], '%Y-%m-%d %H:%M:%S') 
-            for commit in commits_data
-        }
+        return shas, dates, authors, parents
+
+    def process_commit_data(self, 
+                          shas: np.ndarray,
+                          parents: List[List[int]],
+                          branch_data: List[Dict[str, Any]]) -> List[int]:
+        """
+        Process commit data to determine which branches each commit belongs to.
+        Returns one bitset per commit, where bit i is set if it is on branch_data[i].
+        """
+        # Mark each branch tip with its branch bit
+        tip_bits = defaultdict(int)
+        for bi, branch in enumerate(branch_data):
+            tip_bits[branch['commit']] |= 1 << bi
+        reach = [tip_bits.get(sha, 0) for sha in shas.tolist()]
         
-        # Assign commits to branches
-        for branch_name, tip_commit in branch_tips.items():
-            current_commit = tip_commit
-            while current_commit in commit_parents:
-                commit_to_branch[current_commit].append(branch_name)
-                if not commit_parents[current_commit]:
-                    break
-                current_commit = commit_parents[current_commit][0]
-                
-        return commit_to_branch, commit_dates, commit_parents
+        # Propagate branch bits along first-parent links, visiting a commit
+        # only once all of its children have been visited
+        first_parent = [commit_parents[0] if commit_parents else -1 for commit_parents in parents]
+        pending_children = [0] * len(shas)
+        for parent in first_parent:
+            if parent >= 0:
+                pending_children[parent] += 1
+        stack = [idx for idx, count in enumerate(pending_children) if not count]
+        while stack:
+            idx = stack.pop()
+            parent = first_parent[idx]
+            if parent >= 0:
+                reach[parent] |= reach[idx]
+                pending_children[parent] -= 1
+                if not pending_children[parent]:
+                    stack.append(parent)
+        
+        return reach
+
+    @staticmethod
+    def branch_indices(bits: int) -> List[int]:
+        """
+        Return the indices of the set bits in a branch bitset, lowest first
+        """
+        indices = []
+        while bits:
+            low_bit = bits & -bits
+            indices.append(low_bit.bit_length() - 1)
+            bits ^= low_bit
+        return indices
 
     def prepare_visualization_data(self,
                                  commits_data: List[Dict[str, Any]],
-                                 commit_to_branch: Dict[str, List[str]],
-                                 commit_dates: Dict[str, datetime],
-                                 commit_parents: Dict[str, List[str]],
+                                 shas: np.ndarray,
+                                 dates: np.ndarray,
+                                 authors: np.ndarray,
+                                 commit_to_branch: List[int],
                                  branch_to_color: Dict[str, str],
-                                 branch_lanes: Dict[str, int]) -> Tuple[List, List, List, List, List[go.Scatter]]:
+                                 branch_lanes: Dict[str, int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, List[go.Scatter]]:
         """
         Prepare data for visualization including dots and lines
         """
-        dots_x, dots_y, dots_color, dots_text = [], [], [], []
         branch_traces = []
+        detached_lane = len(branch_lanes)
         
-        # Process commits and create branch traces
-        for branch_name, lane in branch_lanes.items():
-            branch_color = branch_to_color[branch_name]
-            branch_commits = sorted(
-                [(sha, commit_dates[sha]) for sha, branches in commit_to_branch.items() if branch_name in branches],
-                key=lambda x: x[1]
-            )
-            
-            if branch_commits:
-                # Create branch line trace
-                x_data = [date for _, date in branch_commits]
-                y_data = [lane] * len(branch_commits)
-                
+        # Lanes follow branch_data order, so bit i of a commit's bitset is lane i
+        branch_names = list(branch_lanes)
+        commit_lanes = [self.branch_indices(bits) for bits in commit_to_branch]
+        
+        # One dot per (commit, branch) pair, detached commits get a single dot
+        total = sum(len(lanes) or 1 for lanes in commit_lanes)
+        dots_commit = np.empty(total, dtype=np.intp)
+        dots_y = np.empty(total, dtype=np.int32)
+        
+        # Walk commits once in date order, filling the dot arrays
+        k = 0
+        for idx in np.argsort(dates, kind='stable').tolist():
+            for lane in commit_lanes[idx] or [detached_lane]:
+                dots_commit[k] = idx
+                dots_y[k] = lane
+                k += 1
+        
+        # Color and hover text only depend on the commit, so build them once per commit
+        commit_colors = np.array([
+            branch_to_color[branch_names[lanes[0]]] if lanes else '#95A5A6'  # Gray for detached commits
+            for lanes in commit_lanes
+        ], dtype=object)
+        commit_texts = np.array([
+            f"Commit: {shas[idx][:7]}<br>"
+            f"Branch: {', '.join(branch_names[lane] for lane in lanes) or '(detached)'}<br>"
+            f"Author: {authors[idx]}<br>"
+            f"Date: {commit['date']}<br>"
+            f"Message: {commit['message_short']}"
+            for idx, (commit, lanes) in enumerate(zip(commits_data, commit_lanes))
+        ], dtype=object)
+        
+        dots_x = dates[dots_commit]
+        dots_color = commit_colors[dots_commit]
+        dots_text = commit_texts[dots_commit]
+        
+        # Group dots by lane once; the stable sort keeps each lane's dots in date order
+        by_lane = np.argsort(dots_y, kind='stable')
+        lanes, lane_starts = np.unique(dots_y[by_lane], return_index=True)
+        
+        # Create branch line traces (lanes ascend in branch_lanes order)
+        for lane, lane_dots in zip(lanes.tolist(), np.split(by_lane, lane_starts[1:])):
+            if lane != detached_lane:
+                branch_name = branch_names[lane]
+                x_data = dots_x[lane_dots]
                 branch_traces.append(go.Scatter(
                     x=x_data,
-                    y=y_data,
+                    y=[lane] * len(x_data),
                     mode='lines',
-                    line=dict(color=branch_color, width=2),
+                    line=dict(color=branch_to_color[branch_name], width=2),
                     name=branch_name,
                     showlegend=True,
                     hoverinfo='none'
                 ))
-
-        # Process commits for dots
-        for commit in commits_data:
-            commit_sha = commit['sha']
-            commit_date = commit_dates[commit_sha]
-            
-            # Handle branches for this commit
-            branches = commit_to_branch[commit_sha]
-            if not branches:
-                branches = ['(detached)']
-                color = '#95A5A6'  # Gray for detached commits
-            else:
-                color = branch_to_color[branches[0]]
-            
-            # Add commit dots
-            for branch in branches:
-                lane = branch_lanes.get(branch, len(branch_lanes))
-                dots_x.append(commit_date)
-                dots_y.append(lane)
-                dots_color.append(color)
-                dots_text.append(
-                    f"Commit: {commit_sha[:7]}<br>"
-                    f"Branch: {', '.join(branches)}<br>"
-                    f"Author: {commit['author']}<br>"
-                    f"Date: {commit_date}<br>"
-                    f"Message: {commit['message'][:50]}..."
-                )
                         
         return dots_x, dots_y, dots_color, dots_text, branch_traces
 
     def create_plotly_figure(self,
-                           dots_x: List[datetime],
-                           dots_y: List[int],
-                           dots_color: List[str],
-                           dots_text: List[str],
+                           dots_x: np.ndarray,
+                           dots_y: np.ndarray,
+                           dots_color: np.ndarray,
+                           dots_text: np.ndarray,
                            branch_traces: List[go.Scatter],
                            branch_lanes: Dict[str, int]) -> go.Figure:
         """
@@ -159,15 +194,15 @@ class BranchVisualizer:
         for trace in branch_traces:
             fig.add_trace(trace)
 
-        # Add commit dots
-        fig.add_trace(go.Scatter(
+        # Add commit dots (WebGL keeps pan/zoom smooth with many points)
+        fig.add_trace(go.Scattergl(
             x=dots_x,
             y=dots_y,
             mode='markers',
             marker=dict(
-                size=12,
+                size=8,
                 color=dots_color,
-                line=dict(width=2, color='white')
+                line=dict(width=1, color='white')
             ),
             text=dots_text,
             hoverinfo='text',
@@ -223,17 +258,16 @@ def create_branch_visualization(commits_data: List[Dict[str, Any]],
     branch_to_color = visualizer.assign_branch_colors(branch_data)
     
     # Process commit data
-    commit_to_branch, commit_dates, commit_parents = visualizer.process_commit_data(
-        commits_data, 
-        branch_data
-    )
+    shas, dates, authors, parents = visualizer.build_commit_arrays(commits_data)
+    commit_to_branch = visualizer.process_commit_data(shas, parents, branch_data)
     
     # Prepare visualization data
     visualization_data = visualizer.prepare_visualization_data(
         commits_data,
+        shas,
+        dates,
+        authors,
         commit_to_branch,
-        commit_dates,
-        commit_parents,
         branch_to_color,
         branch_lanes
     )